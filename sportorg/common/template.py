@@ -1,20 +1,63 @@
 import os
-from typing import Any, List
+import time
+from typing import IO, Any, Dict, List, Tuple
+
+from jinja2 import Template
 
 from sportorg import config, settings
 from sportorg.libs.template import template
 
 
+# directories modified this close to a scan may change again within the same
+# mtime tick (FAT and SMB shares store mtimes with 1-2 s resolution)
+_MTIME_RESOLUTION = 2.0
+
+# (path, exclude_path) ->
+# (scan time, modification times of scanned directories, templates)
+_templates_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, float], List[str]]] = {}
+
+
 def get_templates(path: str = "", exclude_path: str = "") -> List[str]:
     if not path:
         path = settings.template_dir()
     if not exclude_path:
         exclude_path = settings.template_dir()
+
+    key = (path, exclude_path)
+    cached = _templates_cache.get(key)
+    if cached is not None and _is_cache_valid(cached[0], cached[1]):
+        return list(cached[2])
+
+    scanned_at = time.time()
+    dir_mtimes: Dict[str, float] = {}
+    files = _scan_templates(path, exclude_path, dir_mtimes)
+    _templates_cache[key] = (scanned_at, dir_mtimes, files)
+    return list(files)
+
+
+def _is_cache_valid(scanned_at: float, dir_mtimes: Dict[str, float]) -> bool:
+    try:
+        for d, t in dir_mtimes.items():
+            if os.path.getmtime(d) != t:
+                return False
+            # a file added in the same mtime tick as the scan is invisible
+            # to the mtime check, do not trust such a scan
+            if scanned_at - t < _MTIME_RESOLUTION:
+                return False
+    except OSError:
+        return False
+    return True
+
+
+def _scan_templates(
+    path: str, exclude_path: str, dir_mtimes: Dict[str, float]
+) -> List[str]:
+    dir_mtimes[path] = os.path.getmtime(path)
     files = []
     for p in os.listdir(path):
         full_path = os.path.join(path, p)
         if os.path.isdir(full_path):
-            fs = get_templates(full_path)
+            fs = _scan_templates(full_path, settings.template_dir(), dir_mtimes)
             for f in fs:
                 f = f.replace(exclude_path, "")
                 f = f.replace("\\", "/")
@@ -34,3 +77,21 @@ def get_text_from_file(path: str, **kwargs: Any) -> str:
         return template.get_text_from_path(path, **kwargs)
 
     return template.get_text_from_template(settings.template_dir(), path, **kwargs)
+
+
+def get_template(path: str) -> Template:
+    if os.path.isfile(path):
+        return template.get_template_from_path(path)
+
+    return template.get_template(settings.template_dir(), path)
+
+
+def write_text_from_template(tmpl: Template, file: IO[str], **kwargs: Any) -> None:
+    """Render the loaded template directly to the file object, chunk by chunk"""
+    kwargs["name"] = config.NAME
+    kwargs["version"] = str(config.VERSION)
+    tmpl.stream(**kwargs).dump(file)
+
+
+def write_text_from_file(path: str, file: IO[str], **kwargs: Any) -> None:
+    write_text_from_template(get_template(path), file, **kwargs)
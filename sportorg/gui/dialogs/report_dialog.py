@@ -1,7 +1,7 @@
-import codecs
 import logging
 import os
 import webbrowser
+from threading import Thread
 
 from docxtpl import DocxTemplate
 
@@ -27,7 +27,11 @@ except ModuleNotFoundError:
     )
 
 from sportorg import config, settings
-from sportorg.common.template import get_templates, get_text_from_file
+from sportorg.common.template import (
+    get_template,
+    get_templates,
+    write_text_from_template,
+)
 from sportorg.gui.dialogs.file_dialog import (
     get_open_file_name,
     get_save_file_name,
@@ -48,6 +52,38 @@ _settings = {
 }
 
 
+class ReportWriteThread(Thread):
+    """Renders the template to the file without blocking the GUI
+
+    The report is written to a temporary file next to the target and moved
+    over it only after a successful render, so a failed render keeps the
+    previous report intact.
+    """
+
+    def __init__(self, template, file_name, context, open_in_browser=False):
+        super().__init__(name="ReportWriteThread")
+        self.template = template
+        self.file_name = file_name
+        self.context = context
+        self.open_in_browser = open_in_browser
+
+    def run(self):
+        tmp_file_name = "{}.{}.tmp".format(self.file_name, self.ident)
+        try:
+            with open(tmp_file_name, "w", encoding="utf-8", newline="") as file:
+                write_text_from_template(self.template, file, **self.context)
+            os.replace(tmp_file_name, self.file_name)
+        except Exception as e:
+            logging.exception(e)
+            if os.path.exists(tmp_file_name):
+                os.remove(tmp_file_name)
+            return
+
+        # Open file in your browser
+        if self.open_in_browser:
+            webbrowser.open("file://" + self.file_name, new=2)
+
+
 class ReportDialog(QDialog):
     def __init__(self):
         super().__init__(GlobalAccess().get_main_window())
@@ -224,6 +260,15 @@ class ReportDialog(QDialog):
                 template_path_items.remove(i)
         report_suffix = "_".join(template_path_items)
 
+        template_context = dict(
+            race=races_dict[get_current_race_index()],
+            races=races_dict,
+            rent_cards=list(RentCards().get()),
+            current_race=get_current_race_index(),
+            selected={"persons": []},  # leave here for back compatibility
+            settings=settings.SETTINGS.templates_settings,
+        )
+
         if template_path.endswith(".docx"):
             # DOCX template processing
             full_path = settings.template_dir() + template_path
@@ -249,16 +294,8 @@ class ReportDialog(QDialog):
                 os.startfile(file_name)
 
         elif template_path.endswith(".csv"):
-            template = get_text_from_file(
-                template_path,
-                race=races_dict[get_current_race_index()],
-                races=races_dict,
-                rent_cards=list(RentCards().get()),
-                current_race=get_current_race_index(),
-                selected={"persons": []},  # leave here for back compatibility
-                settings=settings.SETTINGS.templates_settings,
-            )
-
+            # load before asking for the file, template errors abort here
+            report_template = get_template(template_path)
             if _settings["save_to_last_file"]:
                 file_name = _settings["last_file"]
             else:
@@ -271,21 +308,10 @@ class ReportDialog(QDialog):
                 )
             if len(file_name):
                 _settings["last_file"] = file_name
-                with codecs.open(file_name, "w", "utf-8") as file:
-                    file.write(template)
-                    file.close()
+                ReportWriteThread(report_template, file_name, template_context).start()
 
         else:
-            template = get_text_from_file(
-                template_path,
-                race=races_dict[get_current_race_index()],
-                races=races_dict,
-                rent_cards=list(RentCards().get()),
-                current_race=get_current_race_index(),
-                selected={"persons": []},  # leave here for back compatibility
-                settings=settings.SETTINGS.templates_settings,
-            )
-
+            report_template = get_template(template_path)
             if _settings["save_to_last_file"]:
                 file_name = _settings["last_file"]
             else:
@@ -298,10 +324,9 @@ class ReportDialog(QDialog):
                 )
             if len(file_name):
                 _settings["last_file"] = file_name
-                with codecs.open(file_name, "w", "utf-8") as file:
-                    file.write(template)
-                    file.close()
-
-                # Open file in your browser
-                if _settings["open_in_browser"]:
-                    webbrowser.open("file://" + file_name, new=2)
+                ReportWriteThread(
+                    report_template,
+                    file_name,
+                    template_context,
+                    open_in_browser=_settings["open_in_browser"],
+                ).start()
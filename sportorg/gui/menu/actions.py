@@ -675,9 +675,7 @@ class GroupFinderAction(Action, metaclass=ActionFactory):
 class PenaltyCalculationAction(Action, metaclass=ActionFactory):
     def execute(self):
         logging.debug("Penalty calculation start")
-        for result in race().results:
-            if result.person:
-                ResultChecker.checking(result)
+        ResultChecker.check_all()
         logging.debug("Penalty calculation finish")
         recalculate_results(recheck_results=False)
         self.app.refresh()
@@ -104,12 +104,20 @@ class AbstractSportOrgMemoryModel(QAbstractTableModel):
             try:
                 row = index.row()
                 column = index.column()
-                answer = self.cache[row][column]
+                answer = self.get_cached_row(row)[column]
                 return answer
             except Exception as e:
                 logging.error(str(e))
         return
 
+    def get_cached_row(self, row):
+        values = self.cache[row]
+        if values is None:
+            # row is formatted on first access, see ResultMemoryModel.init_cache
+            values = self.get_data(row)
+            self.cache[row] = values
+        return values
+
     def clear_filter(self, remove_condition=True):
         if remove_condition:
             self.filter.clear()
@@ -312,7 +320,9 @@ class AbstractSportOrgMemoryModel(QAbstractTableModel):
 
     def get_column_unique_values(self, n_col):
         # returns sorted unique values from specified column
-        return sorted(set([str(row[n_col]) for row in self.cache]))
+        return sorted(
+            set([str(self.get_cached_row(i)[n_col]) for i in range(len(self.cache))])
+        )
 
 
 class PersonMemoryModel(AbstractSportOrgMemoryModel):
@@ -447,12 +457,16 @@ class ResultMemoryModel(AbstractSportOrgMemoryModel):
         return str(len(self.cache) - index)
 
     def init_cache(self):
+        # results are formatted lazily in get_cached_row, only rows
+        # shown by the view are converted to strings. Rows are taken from
+        # a snapshot, new results are inserted at the top of race.results
+        # before the table is refreshed
+        self._rows = list(self.race.results)
         self.cache.clear()
-        for row in range(len(self.race.results)):
-            self.cache.append(self.get_data(row))
+        self.cache.extend([None] * len(self._rows))
 
     def get_data(self, position):
-        ret = self.get_values_from_object(self.race.results[position])
+        ret = self.get_values_from_object(self._rows[position])
         return ret
 
     def duplicate(self, position):
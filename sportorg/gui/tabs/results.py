@@ -1,4 +1,6 @@
+import html
 import logging
+from typing import Optional
 
 try:
     from PySide6 import QtCore, QtGui, QtWidgets
@@ -16,6 +18,17 @@ from sportorg.language import translate
 from sportorg.models.memory import Result, race
 from sportorg.utils.time import time_to_hhmmss
 
+_ZERO_TIME = OTime()
+
+_START_FMT = "{:<8} {}".format
+_FINISH_FMT = "{:<8} {} {}".format
+_CORRECT_SPLIT_FMT = "{:02d} {} {} {}".format
+_INCORRECT_SPLIT_FMT = "-- {} {}".format
+_RED_HIGHLIGHT = '<span style="background: red">{}</span>'.format
+_YELLOW_HIGHLIGHT = '<span style="background: yellow">{}</span>'.format
+# keeps the spacing of the split lines without the margins and font of a bare <pre>
+_SPLITS_BLOCK = "<pre style=\"margin:0; font-family:'Courier New'\">{}</pre>".format
+
 
 class ResultsTable(TableView):
     def __init__(self, parent, obj):
@@ -31,36 +44,39 @@ class ResultsTable(TableView):
         self.clicked.connect(self.entry_single_clicked)
         self.activated.connect(self.double_clicked)
 
+        # show splits once the arrow key is released or held key repeats pause
+        self.navigation_timer = QtCore.QTimer(self)
+        self.navigation_timer.setSingleShot(True)
+        self.navigation_timer.setInterval(40)
+        self.navigation_timer.timeout.connect(
+            lambda: self.entry_single_clicked(self.currentIndex())
+        )
+
         self.popup_items = []
 
     def update_splits(self):
         if -1 < self.currentIndex().row() < len(race().results):
-            self.parent_widget.show_splits(self.currentIndex())
+            self.parent_widget.show_splits(self.currentIndex(), force=True)
 
     def keyPressEvent(self, event):
         super().keyPressEvent(event)
-        try:
-            if event.key() == QtCore.Qt.Key_Up or event.key() == QtCore.Qt.Key_Down:
-                self.entry_single_clicked(self.currentIndex())
-        except Exception as e:
-            logging.error(str(e))
+        if event.key() == QtCore.Qt.Key_Up or event.key() == QtCore.Qt.Key_Down:
+            self.navigation_timer.start()
 
     def entry_single_clicked(self, index):
-        try:
-            #  show splits in the left area
-            if -1 < index.row() < len(race().results):
-                self.parent_widget.show_splits(index)
-        except Exception as e:
-            logging.error(str(e))
+        #  show splits in the left area
+        if -1 < index.row() < len(race().results):
+            self.parent_widget.show_splits(index)
 
     def double_clicked(self, index):
+        logging.debug("Clicked on %s", str(index.row()))
+        if not -1 < index.row() < len(race().results):
+            return
         try:
-            logging.debug("Clicked on %s", str(index.row()))
-            if index.row() < len(race().results):
-                dialog = ResultEditDialog(race().results[index.row()])
-                dialog.exec_()
-                GlobalAccess().get_main_window().refresh()
-                # self.selectRow(index.row()+1)
+            dialog = ResultEditDialog(race().results[index.row()])
+            dialog.exec_()
+            GlobalAccess().get_main_window().refresh()
+            # self.selectRow(index.row()+1)
         except Exception as e:
             logging.error(str(e))
 
@@ -93,6 +109,7 @@ class Widget(QtWidgets.QWidget):
         self.vertical_layout_course = QtWidgets.QVBoxLayout(
             self.result_course_group_box
         )
+        self.shown_result: Optional[Result] = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -120,10 +137,10 @@ class Widget(QtWidgets.QWidget):
             1, QtWidgets.QFormLayout.FieldRole, self.result_course_length_edit
         )
         self.vertical_layout_course.addLayout(self.result_course_form)
+        self.result_course_details.setLineWrapMode(QTextEdit.NoWrap)
 
-        font = QtGui.QFont()
-        font.setFamily("Courier New")
-        self.result_course_details.setFont(font)
+        mono_font = QtGui.QFont("Courier New")
+        self.result_course_details.setFont(mono_font)
         self.vertical_layout_course.addWidget(self.result_course_details)
         self.vertical_layout_card.setContentsMargins(0, 0, 0, 0)
         self.vertical_layout_card.setSpacing(0)
@@ -143,9 +160,7 @@ class Widget(QtWidgets.QWidget):
         )
         self.vertical_layout_card.addLayout(self.result_card_form)
         self.result_card_details.setLineWrapMode(QTextEdit.NoWrap)
-        font = QtGui.QFont()
-        font.setFamily("Courier New")
-        self.result_card_details.setFont(font)
+        self.result_card_details.setFont(mono_font)
         self.vertical_layout_card.addWidget(self.result_card_details)
 
         self.grid_layout.addWidget(self.result_splitter)
@@ -159,89 +174,104 @@ class Widget(QtWidgets.QWidget):
         self.result_course_group_box.setMinimumHeight(150)
         self.result_card_group_box.setMinimumHeight(150)
 
-    def show_splits(self, index):
+    def show_splits(self, index, force=False):
         result: Result = race().results[index.row()]
-        self.result_card_details.clear()
+        # re-clicking the row of the shown result changes nothing,
+        # data changes come through update_splits with force=True
+        if result is self.shown_result and not force:
+            return
+
+        details = (self.result_card_details, self.result_course_details)
+        for widget in details:
+            widget.setUpdatesEnabled(False)
+            widget.blockSignals(True)
+        try:
+            self._fill_splits(result)
+            self.shown_result = result
+        finally:
+            for widget in details:
+                widget.blockSignals(False)
+                widget.setUpdatesEnabled(True)
+                widget.update()
+
+    def _fill_splits(self, result: Result):
+        obj = race()
         self.result_card_finish_edit.setText("")
         self.result_card_start_edit.setText("")
-
-        self.result_course_details.clear()
-        self.result_course_details.setLineWrapMode(QTextEdit.NoWrap)
         self.result_course_name_edit.setText("")
         self.result_course_length_edit.setText("")
 
+        # both panes are replaced with setHtml below
         if result.is_manual():
+            self.result_card_details.clear()
+            self.result_course_details.clear()
             return
 
         course = None
         if result.person:
-            course = race().find_course(result)
+            course = obj.find_course(result)
 
-        control_codes = []
+        control_codes = frozenset()
         is_highlight = True
         if course:
             is_highlight = not course.is_unknown()
-            for control in course.controls:
-                control_codes.append(str(control.code))
+            control_codes = frozenset(str(control.code) for control in course.controls)
 
-        time_accuracy = race().get_setting("time_accuracy", 0)
-        code = ""
-        last_correct_time = OTime()
+        time_accuracy = obj.get_setting("time_accuracy", 0)
+        start_label = translate("Start")
+        finish_label = translate("Finish")
+        split_codes = [str(split.code) for split in result.splits]
+        prev_code = ""
+        last_correct_time = _ZERO_TIME
 
-        start_fmt = "{name:<8} {time}"
         start_time = result.get_start_time()
-        start_str = start_fmt.format(
-            name=translate("Start"), time=start_time.to_str(time_accuracy)
-        )
-        self.result_card_details.append(start_str)
+        card_lines = [
+            html.escape(_START_FMT(start_label, start_time.to_str(time_accuracy)))
+        ]
 
-        str_fmt_correct = "{index:02d} {code} {time} {diff}"
-        str_fmt_incorrect = "-- {code} {time}"
         index = 1
-        for split in result.splits:
-            str_fmt = str_fmt_correct
-            if not split.is_correct:
-                str_fmt = str_fmt_incorrect
-
-            s = str_fmt.format(
-                index=index,
-                code=("(" + str(split.code) + ")   ")[:5],
-                time=split.time.to_str(time_accuracy),
-                diff=split.leg_time.to_str(time_accuracy),
-                leg_place=split.leg_place,
-                speed=split.speed,
-            )
+        for split, split_code in zip(result.splits, split_codes):
+            code_column = f"({split_code})   "[:5]
             if split.is_correct:
+                s = _CORRECT_SPLIT_FMT(
+                    index,
+                    code_column,
+                    split.time.to_str(time_accuracy),
+                    split.leg_time.to_str(time_accuracy),
+                )
                 index += 1
                 last_correct_time = split.time
+            else:
+                s = _INCORRECT_SPLIT_FMT(code_column, split.time.to_str(time_accuracy))
+            s = html.escape(s)
 
-            if split.code == code:
-                s = '<span style="background: red">{}</span>'.format(s)
-            if is_highlight and len(control_codes) and split.code not in control_codes:
-                s = '<span style="background: yellow">{}</span>'.format(s)
+            if split_code == prev_code:
+                s = _RED_HIGHLIGHT(s)
+            if is_highlight and len(control_codes) and split_code not in control_codes:
+                s = _YELLOW_HIGHLIGHT(s)
 
-            self.result_card_details.append(s)
-            code = split.code
+            card_lines.append(s)
+            prev_code = split_code
 
         finish_time = result.get_finish_time()
         finish_leg = finish_time - last_correct_time
-        finish_fmt = "{name:<8} {time} {diff}"
-        finish_str = finish_fmt.format(
-            name=translate("Finish"),
-            time=finish_time.to_str(time_accuracy),
-            diff=finish_leg.to_str(time_accuracy),
+        card_lines.append(
+            html.escape(
+                _FINISH_FMT(
+                    finish_label,
+                    finish_time.to_str(time_accuracy),
+                    finish_leg.to_str(time_accuracy),
+                )
+            )
         )
-        self.result_card_details.append(finish_str)
+        self.result_card_details.setHtml(_SPLITS_BLOCK("<br>".join(card_lines)))
 
-        self.result_card_finish_edit.setText(time_to_hhmmss(result.get_finish_time()))
-        self.result_card_start_edit.setText(time_to_hhmmss(result.get_start_time()))
+        self.result_card_finish_edit.setText(time_to_hhmmss(finish_time))
+        self.result_card_start_edit.setText(time_to_hhmmss(start_time))
 
-        split_codes = []
-        for split in result.splits:
-            split_codes.append(split.code)
+        punched_codes = frozenset(split_codes)
 
-        start_str = translate("Start")
-        self.result_course_details.append(start_str)
+        course_lines = [html.escape(start_label)]
         if course:
             index = 1
             for control in course.controls:
@@ -250,13 +280,14 @@ class Widget(QtWidgets.QWidget):
                     code=control.code,
                     length=control.length if control.length else "",
                 )
-                if is_highlight and str(control.code) not in split_codes:
-                    s = '<span style="background: yellow">{}</span>'.format(s)
-                self.result_course_details.append(s)
+                s = html.escape(s)
+                if is_highlight and str(control.code) not in punched_codes:
+                    s = _YELLOW_HIGHLIGHT(s)
+                course_lines.append(s)
                 index += 1
 
             self.result_course_name_edit.setText(course.name)
             self.result_course_name_edit.setCursorPosition(0)
             self.result_course_length_edit.setText(str(course.length))
-        finish_str = translate("Finish")
-        self.result_course_details.append(finish_str)
+        course_lines.append(html.escape(finish_label))
+        self.result_course_details.setHtml(_SPLITS_BLOCK("<br>".join(course_lines)))
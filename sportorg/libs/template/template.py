@@ -37,25 +37,30 @@ def finalize(thing):
     return thing if thing else ""
 
 
-def get_text_from_path(path, **kwargs):
+def get_template_from_path(path):
     custom_encoding = locale.getdefaultlocale()[1] or "utf-8"
     with open(path, errors="ignore") as f:
         html = f.read().encode(custom_encoding, "ignore").decode(errors="ignore")
 
-    template = Template(html, finalize=finalize)
-    return template.render(**kwargs)
+    return Template(html, finalize=finalize)
+
+
+def get_text_from_path(path, **kwargs):
+    return get_template_from_path(path).render(**kwargs)
 
 
 def compress(data: str) -> str:
     return base64.b64encode(gzip.compress(data.encode())).decode()
 
 
-def get_text_from_template(searchpath: str, path: str, **kwargs):
+def get_template(searchpath: str, path: str):
     env = Environment(loader=FileSystemLoader(searchpath), finalize=finalize)
     env.filters["tohhmmss"] = to_hhmmss
     env.filters["date"] = date
     env.filters["compress"] = compress
     env.policies["json.dumps_kwargs"]["ensure_ascii"] = False
-    template = env.get_template(path)
+    return env.get_template(path)
+
 
-    return template.render(**kwargs)
+def get_text_from_template(searchpath: str, path: str, **kwargs):
+    return get_template(searchpath, path).render(**kwargs)
@@ -296,6 +296,7 @@ class Course(Model):
 class Group(Model):
     def __init__(self):
         self.id = uuid.uuid4()
+        self._forced_penalty_mode: Optional[str] = None
         self.name = ""
         self.course: Optional[Course] = None
         self.is_any_course = False
@@ -326,6 +327,28 @@ class Group(Model):
     def __repr__(self) -> str:
         return "Group {}".format(self.name)
 
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, new_name: str):
+        self._name = new_name
+        # use prefixes _min and _lap in group name to force non-standard penalty
+        # TODO move setting to group properties
+        name = str(new_name).lower()
+        if "_lap" in name:
+            self._forced_penalty_mode = "laps"
+        elif "_min" in name:
+            self._forced_penalty_mode = "time"
+        else:
+            self._forced_penalty_mode = None
+
+    @property
+    def forced_penalty_mode(self) -> Optional[str]:
+        """Marked route penalty mode forced by the group name, if any"""
+        return self._forced_penalty_mode
+
     def get_count_finished(self):
         return self.count_finished
 
@@ -426,6 +449,22 @@ class Split(Model):
     def __repr__(self) -> str:
         return self.code
 
+    @property
+    def code(self):
+        return self._code
+
+    @code.setter
+    def code(self, value):
+        self._code = value
+        self._code_int = None
+
+    @property
+    def code_int(self) -> int:
+        """int(code), converted once per assignment of code"""
+        if self._code_int is None:
+            self._code_int = int(self._code)
+        return self._code_int
+
     @property
     def time(self):
         return self._time
@@ -1,50 +1,174 @@
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
 from sportorg.common.otime import OTime
 from sportorg.models.constant import StatusComments
 from sportorg.models.memory import (
+    ControlPoint,
+    Course,
     Person,
+    Race,
     Result,
     ResultSportident,
     ResultStatus,
-    find,
     race,
 )
 
 
+# "31(31,32,33)": the correct code and the list of accepted codes
+_OPTIONAL_CODES_RE = re.compile(r"\s*(\d+)\s*\(([^(]*)")
+
+# statuses that are set by the checker and can be rechecked
+_CHECKED_STATUSES = frozenset(
+    {
+        ResultStatus.OK,
+        ResultStatus.MISSING_PUNCH,
+        ResultStatus.OVERTIME,
+        ResultStatus.MISS_PENALTY_LAP,
+        ResultStatus.MULTI_DAY_ISSUE,
+    }
+)
+
+
 class ResultCheckerException(Exception):
     pass
 
 
+@dataclass
+class _CheckContext:
+    """Race settings read once per checking pass and the course of the result"""
+
+    race: Race
+    result_processing_mode: str
+    scores_allow_duplicates: bool
+    scores_minute_penalty: int
+    scores_max_overrun_time: int
+    score_mode: str
+    fixed_score_value: float
+    marked_route_mode: str
+    marked_route_dont_dsq: bool
+    marked_route_if_station_check: bool
+    marked_route_penalty_lap_station_code: int
+    marked_route_max_penalty_by_cp: bool
+    marked_route_penalty_time: int
+    credit_time_enabled: bool
+    credit_time_cp: int
+    _course_result: Optional[Result] = field(default=None, repr=False)
+    _course: Optional[Course] = field(default=None, repr=False)
+    _incorrect_codes: Dict[int, FrozenSet[str]] = field(
+        default_factory=dict, repr=False
+    )
+    _ardf_orders: Dict[int, List[Tuple[str, object]]] = field(
+        default_factory=dict, repr=False
+    )
+    _controls_by_code: Optional[Dict[str, ControlPoint]] = field(
+        default=None, repr=False
+    )
+
+    @classmethod
+    def from_race(cls, obj: Race) -> "_CheckContext":
+        return cls(
+            race=obj,
+            result_processing_mode=obj.get_setting("result_processing_mode", "time"),
+            scores_allow_duplicates=obj.get_setting(
+                "result_processing_scores_allow_duplicates", False
+            ),
+            scores_minute_penalty=obj.get_setting(
+                "result_processing_scores_minute_penalty", 1
+            ),
+            scores_max_overrun_time=obj.get_setting(
+                "result_processing_scores_max_overrun_time", 0
+            ),
+            score_mode=obj.get_setting("result_processing_score_mode", "fixed"),
+            fixed_score_value=obj.get_setting(
+                "result_processing_fixed_score_value", 1.0
+            ),
+            marked_route_mode=obj.get_setting("marked_route_mode", "off"),
+            marked_route_dont_dsq=obj.get_setting("marked_route_dont_dsq", False),
+            marked_route_if_station_check=obj.get_setting(
+                "marked_route_if_station_check"
+            ),
+            marked_route_penalty_lap_station_code=obj.get_setting(
+                "marked_route_penalty_lap_station_code"
+            ),
+            marked_route_max_penalty_by_cp=obj.get_setting(
+                "marked_route_max_penalty_by_cp", False
+            ),
+            marked_route_penalty_time=obj.get_setting(
+                "marked_route_penalty_time", 60000
+            ),
+            credit_time_enabled=obj.get_setting("credit_time_enabled", False),
+            credit_time_cp=obj.get_setting("credit_time_cp", 250),
+        )
+
+    def find_course(self, result: Result) -> Optional[Course]:
+        # the course is searched once for all checks of the same result
+        if result is not self._course_result:
+            self._course = self.race.find_course(result)
+            self._course_result = result
+        return self._course
+
+    def get_incorrect_codes(self, course: Course) -> FrozenSet[str]:
+        # parsed once per course, not for every result on it
+        codes = self._incorrect_codes.get(id(course))
+        if codes is None:
+            codes = frozenset(
+                ResultChecker.get_marked_route_incorrect_list(course.controls)
+            )
+            self._incorrect_codes[id(course)] = codes
+        return codes
+
+    def get_ardf_order(self, course: Course) -> List[Tuple[str, object]]:
+        order = self._ardf_orders.get(id(course))
+        if order is None:
+            order = ResultChecker.get_ardf_order(course.controls)
+            self._ardf_orders[id(course)] = order
+        return order
+
+    def find_control(self, code: str) -> Optional[ControlPoint]:
+        if self._controls_by_code is None:
+            self._controls_by_code = {}
+            for control in self.race.controls:
+                # first control wins, as with find()
+                self._controls_by_code.setdefault(control.code, control)
+        return self._controls_by_code.get(code)
+
+
 class ResultChecker:
     def __init__(self, person: Person):
         self.person = person
 
-    def check_result(self, result: ResultSportident):
+    def check_result(
+        self, result: ResultSportident, context: Optional[_CheckContext] = None
+    ):
         if self.person is None:
             return True
         if self.person.group is None:
             return True
 
-        if race().get_setting("result_processing_mode", "time") == "ardf":
-            result.scores_ardf = self.calculate_scores_ardf(result)
+        if context is None:
+            context = _CheckContext.from_race(race())
+
+        if context.result_processing_mode == "ardf":
+            result.scores_ardf = self.calculate_scores_ardf(result, context)
             return True
-        elif race().get_setting("result_processing_mode", "time") == "scores":
+        elif context.result_processing_mode == "scores":
             # process by score (rogaine)
-            allow_duplicates = race().get_setting(
-                "result_processing_scores_allow_duplicates", False
+            score = self.calculate_rogaine_score(
+                result, context.scores_allow_duplicates, context
             )
-            penalty_step = race().get_setting(
-                "result_processing_scores_minute_penalty", 1
+            penalty = self.calculate_rogaine_penalty(
+                result, score, context.scores_minute_penalty
             )
-
-            score = self.calculate_rogaine_score(result, allow_duplicates)
-            penalty = self.calculate_rogaine_penalty(result, score, penalty_step)
             result.rogaine_score = score - penalty
             result.rogaine_penalty = penalty
             return True
 
-        course = race().find_course(result)
+        course = context.find_course(result)
 
-        if race().get_setting("marked_route_dont_dsq", False):
+        if context.marked_route_dont_dsq:
             # mode: competition without disqualification for mispunching (add penalty for missing cp)
             result.check(course)
             return True
@@ -60,44 +184,37 @@ class ResultChecker:
         return result.check(course)
 
     @classmethod
-    def checking(cls, result):
+    def checking(cls, result, context: Optional[_CheckContext] = None):
         if result.person is None:
             raise ResultCheckerException("Not person")
         o = cls(result.person)
-        if result.status in [
-            ResultStatus.OK,
-            ResultStatus.MISSING_PUNCH,
-            ResultStatus.OVERTIME,
-            ResultStatus.MISS_PENALTY_LAP,
-            ResultStatus.MULTI_DAY_ISSUE,
-        ]:
+        if result.status in _CHECKED_STATUSES:
+            if context is None:
+                context = _CheckContext.from_race(race())
+
             result.status = ResultStatus.OK
 
-            check_flag = o.check_result(result)
-            ResultChecker.calculate_penalty(result)
-            ResultChecker.calculate_credit_time(result)
+            check_flag = o.check_result(result, context)
+            ResultChecker.calculate_penalty(result, context)
+            ResultChecker.calculate_credit_time(result, context)
             if not check_flag:
                 result.status = ResultStatus.MISSING_PUNCH
 
-            elif not cls.check_penalty_laps(result):
+            elif not cls.check_penalty_laps(result, context):
                 result.status = ResultStatus.MISS_PENALTY_LAP
 
             elif result.person.group and result.person.group.max_time.to_msec():
-                rp_mode = race().get_setting("result_processing_mode", "time")
-                result_time = result.get_result_otime()
-                max_time = result.person.group.max_time
+                rp_mode = context.result_processing_mode
+                result_msec = result.get_result_otime().to_msec()
+                max_msec = result.person.group.max_time.to_msec()
                 if rp_mode in ("time", "ardf"):
-                    if result_time > max_time:
+                    if result_msec > max_msec:
                         result.status = ResultStatus.OVERTIME
                 elif rp_mode == "scores":
-                    max_overrun_time = OTime(
-                        msec=race().get_setting(
-                            "result_processing_scores_max_overrun_time", 0
-                        )
-                    )
+                    max_overrun_msec = context.scores_max_overrun_time
                     if (
-                        max_overrun_time.to_msec() > 0
-                        and result_time > max_time + max_overrun_time
+                        max_overrun_msec > 0
+                        and result_msec > max_msec + max_overrun_msec
                     ):
                         result.status = ResultStatus.OVERTIME
 
@@ -109,24 +226,29 @@ class ResultChecker:
 
     @staticmethod
     def check_all():
-        for result in race().results:
+        context = _CheckContext.from_race(race())
+        for result in context.race.results:
             if result.person:
-                ResultChecker.checking(result)
+                ResultChecker.checking(result, context)
 
     @staticmethod
-    def calculate_credit_time(result: Result):
-        credit_time_enabled = race().get_setting("credit_time_enabled", False)
-        if not credit_time_enabled:
+    def calculate_credit_time(result: Result, context: Optional[_CheckContext] = None):
+        if context is None:
+            context = _CheckContext.from_race(race())
+        if not context.credit_time_enabled:
             return
 
-        credit_cp = race().get_setting("credit_time_cp", 250)
         splits = result.splits
 
-        result.credit_time = ResultChecker.credit_calculation(splits, credit_cp)
+        result.credit_time = ResultChecker.credit_calculation(
+            splits, context.credit_time_cp
+        )
 
     @staticmethod
-    def calculate_penalty(result: Result):
-        mode = race().get_setting("marked_route_mode", "off")
+    def calculate_penalty(result: Result, context: Optional[_CheckContext] = None):
+        if context is None:
+            context = _CheckContext.from_race(race())
+        mode = context.marked_route_mode
         if mode == "off":
             return
 
@@ -137,34 +259,33 @@ class ResultChecker:
         if person.group is None:
             return
 
-        course = race().find_course(result)
+        course = context.find_course(result)
         if not course:
             return
 
         controls = course.controls
         splits = result.splits
 
-        # use prefixes _min and _lap in group name to force non-standard penalty
-        # TODO move setting to group properties
-        if person.group.name.lower().find("_min") > -1:
-            mode = "time"
-        if person.group.name.lower().find("_lap") > -1:
-            mode = "laps"
+        if person.group.forced_penalty_mode:
+            mode = person.group.forced_penalty_mode
 
-        if mode == "laps" and race().get_setting("marked_route_if_station_check"):
-            lap_station = race().get_setting("marked_route_penalty_lap_station_code")
+        if mode == "laps" and context.marked_route_if_station_check:
+            lap_station = context.marked_route_penalty_lap_station_code
             splits, _ = ResultChecker.detach_penalty_laps2(splits, lap_station)
 
-        if race().get_setting("marked_route_dont_dsq", False):
+        if context.marked_route_dont_dsq:
             # free order, don't penalty for extra cp
             penalty = ResultChecker.penalty_calculation_free_order(splits, controls)
         else:
             # marked route with penalty
             penalty = ResultChecker.penalty_calculation(
-                splits, controls, check_existence=True
+                splits,
+                controls,
+                check_existence=True,
+                incorrect_array=context.get_incorrect_codes(course),
             )
 
-        if race().get_setting("marked_route_max_penalty_by_cp", False):
+        if context.marked_route_max_penalty_by_cp:
             # limit the penalty by quantity of controls
             penalty = min(len(controls), penalty)
 
@@ -174,37 +295,36 @@ class ResultChecker:
         if mode == "laps":
             result.penalty_laps = penalty
         elif mode == "time":
-            time_for_one_penalty = OTime(
-                msec=race().get_setting("marked_route_penalty_time", 60000)
-            )
+            time_for_one_penalty = OTime(msec=context.marked_route_penalty_time)
             result.penalty_time = time_for_one_penalty * penalty
 
     @staticmethod
     def get_marked_route_incorrect_list(controls):
-        ret = []
+        ret = {}
         for i in controls:
-            code_str = str(i.code)
-            if code_str and "(" in code_str:
-                correct = code_str.split("(")[0].strip()
-                if correct.isdigit():
-                    for cp in code_str.split("(")[1].split(","):
-                        cp = cp.strip(")").strip()
-                        if cp != correct and cp.isdigit():
-                            if cp not in ret:
-                                ret.append(cp)
-        return ret
+            match = _OPTIONAL_CODES_RE.match(str(i.code))
+            if match:
+                correct, options = match.groups()
+                for cp in options.split(","):
+                    cp = cp.strip(")").strip()
+                    if cp != correct and cp.isdigit():
+                        ret[cp] = None
+        return list(ret)
 
     @staticmethod
     def credit_calculation(splits, credit_cp):
-        result_credit_time = OTime()
+        # sum in msec, one OTime for the total instead of two per leg
+        credit_msec = 0
         for idx, split in enumerate(splits):
-            if int(split.code) == credit_cp and idx > 0:
-                result_credit_time += split.time - splits[idx - 1].time
+            if split.code_int == credit_cp and idx > 0:
+                credit_msec += split.time.to_msec() - splits[idx - 1].time.to_msec()
 
-        return result_credit_time
+        return OTime(msec=credit_msec)
 
     @staticmethod
-    def penalty_calculation(splits, controls, check_existence=False):
+    def penalty_calculation(
+        splits, controls, check_existence=False, *, incorrect_array=None
+    ):
         """:return quantity of incorrect or duplicated punches, order is ignored
         ```
         origin: 31,41,51; athlete: 31,41,51; result:0
@@ -250,18 +370,26 @@ class ResultChecker:
             # add 1 penalty score for missing points
             res = len(origin_array) - len(user_array)
 
-        incorrect_array = ResultChecker.get_marked_route_incorrect_list(controls)
+        if incorrect_array is None:
+            incorrect_array = ResultChecker.get_marked_route_incorrect_list(controls)
 
         if len(incorrect_array) > 0:
             # marked route with choice, controls like 31(31,131), penalty only wrong choice (once),
             # ignoring controls from another courses, previous punches on uncleared card, duplicates
             # this mode allows combination of marked route and classic course, but please use different controls
+            user_codes = set(user_array)
             for i in incorrect_array:
-                if i in user_array:
+                if i in user_codes:
                     res += 1
-        else:
+        elif "0" not in origin_array:
             # classic penalty model - count correct control punch only once, others are recognized as incorrect
             # used for orientathlon, corridor training with choice
+            # multiset difference leaves only incorrect and duplicated values
+            extra = Counter(user_array) - Counter(origin_array)
+            res += sum(extra.values())
+        else:
+            # same with wildcards, each one takes the first punch left,
+            # so the order of removal matters
             for i in origin_array:
                 # remove correct points (only one object per loop)
                 if i == "0" and len(user_array):
@@ -298,22 +426,15 @@ class ResultChecker:
         origin: 40,* ,* ,90; athlete: 40,41,90,90; result:0 TODO:1 - only one incorrect case
         ```
         """
-        res = 0
-        correct_count = 0
-        for i in splits:
-            if not i.has_penalty:
-                correct_count += 1
-
-        res += max(len(controls) - correct_count, 0)
-
-        return res
+        correct_count = sum(not i.has_penalty for i in splits)
+        return max(len(controls) - correct_count, 0)
 
     @staticmethod
     def detach_penalty_laps(splits, lap_station):
         if not splits:
             return [], []
         for idx, punch in enumerate(reversed(splits)):
-            if int(punch.code) != lap_station:
+            if punch.code_int != lap_station:
                 break
         else:
             idx = len(splits)
@@ -325,33 +446,39 @@ class ResultChecker:
         """Detaches penalty laps from the given list of splits
         based on the provided lap station code.
         """
-        if not splits:
-            return [], []
-        regular = [
-            punch
-            for punch in splits
-            if (punch.is_correct or int(punch.code) != lap_station)
-        ]
-        penalty = [
-            punch
-            for punch in splits
-            if (int(punch.code) == lap_station and not punch.is_correct)
-        ]
+        regular = []
+        penalty = []
+        for punch in splits:
+            if not punch.is_correct and punch.code_int == lap_station:
+                penalty.append(punch)
+            else:
+                regular.append(punch)
         return regular, penalty
 
     @staticmethod
-    def check_penalty_laps(result):
+    def count_penalty_laps(splits, lap_station) -> int:
+        """Counts the splits that detach_penalty_laps2 puts into penalty laps"""
+        return sum(
+            1
+            for punch in splits
+            if not punch.is_correct and punch.code_int == lap_station
+        )
+
+    @staticmethod
+    def check_penalty_laps(result, context: Optional[_CheckContext] = None):
         assert isinstance(result, Result)
 
-        mode = race().get_setting("marked_route_mode", "off")
-        check_laps = race().get_setting("marked_route_if_station_check")
+        if context is None:
+            context = _CheckContext.from_race(race())
 
-        if mode == "laps" and check_laps:
-            lap_station = race().get_setting("marked_route_penalty_lap_station_code")
-            _, penalty_laps = ResultChecker.detach_penalty_laps2(
+        if (
+            context.marked_route_mode == "laps"
+            and context.marked_route_if_station_check
+        ):
+            lap_station = context.marked_route_penalty_lap_station_code
+            num_penalty_laps = ResultChecker.count_penalty_laps(
                 result.splits, lap_station
             )
-            num_penalty_laps = len(penalty_laps)
 
             if num_penalty_laps < result.penalty_laps:
                 return False
@@ -359,21 +486,24 @@ class ResultChecker:
         return True
 
     @staticmethod
-    def get_control_score(code):
-        obj = race()
-        control = find(obj.controls, code=str(code))
+    def get_control_score(code, context: Optional[_CheckContext] = None):
+        if context is None:
+            context = _CheckContext.from_race(race())
+        control = context.find_control(str(code))
         if control and control.score:
             return control.score
 
-        if obj.get_setting("result_processing_score_mode", "fixed") == "fixed":
-            return obj.get_setting(
-                "result_processing_fixed_score_value", 1.0
-            )  # fixed score per control
+        if context.score_mode == "fixed":
+            return context.fixed_score_value  # fixed score per control
         else:
             return int(code) // 10  # score = code / 10
 
     @staticmethod
-    def calculate_rogaine_score(result: Result, allow_duplicates: bool = False) -> int:
+    def calculate_rogaine_score(
+        result: Result,
+        allow_duplicates: bool = False,
+        context: Optional[_CheckContext] = None,
+    ) -> int:
         """
         Calculates the rogaine score for a given result.
 
@@ -387,14 +517,22 @@ class ResultChecker:
         If `allow_duplicates` flag is `True`, the function allows duplicate control points
         to be included in the score calculation.
         """
-        user_array = []
-        score = 0
+        codes = [str(cur_split.code) for cur_split in result.splits]
+        if not allow_duplicates:
+            # ordered unique codes
+            codes = dict.fromkeys(codes)
 
-        for cur_split in result.splits:
-            code = str(cur_split.code)
-            if code not in user_array or allow_duplicates:
-                user_array.append(code)
-                score += ResultChecker.get_control_score(code)
+        if context is None:
+            context = _CheckContext.from_race(race())
+
+        score_table = {}
+        score = 0
+        for code in codes:
+            control_score = score_table.get(code)
+            if control_score is None:
+                control_score = ResultChecker.get_control_score(code, context)
+                score_table[code] = control_score
+            score += control_score
 
         return score
 
@@ -416,11 +554,10 @@ class ResultChecker:
         """
         penalty = 0
         if result.person and result.person.group:
-            user_time = result.get_result_otime()
-            max_time = result.person.group.max_time
-            if OTime() < max_time < user_time:
-                time_diff = user_time - max_time
-                seconds_diff = time_diff.to_sec()
+            user_msec = result.get_result_otime().to_msec()
+            max_msec = result.person.group.max_time.to_msec()
+            if 0 < max_msec < user_msec:
+                seconds_diff = (user_msec - max_msec) // 1000
                 minutes_diff = (seconds_diff + 59) // 60  # note, 1:01 = 2 minutes
                 penalty = minutes_diff * penalty_step
 
@@ -430,47 +567,74 @@ class ResultChecker:
         return penalty
 
     @staticmethod
-    def calculate_scores_ardf(result):
-        user_array = []
+    def get_ardf_order(controls) -> List[Tuple[str, object]]:
+        """
+        Parses ARDF course controls into (kind, payload) pairs:
+        ("exact", code), ("any", None) for "?" and ("choice", frozenset of codes)
+        for "?(31,32)".
+        """
+        order = []
+        for control in controls:
+            code = str(control.code)
+            if "?" in code:
+                if "(" in code and ")" in code:
+                    order.append(("choice", frozenset(code.strip("?()").split(","))))
+                else:
+                    order.append(("any", None))
+            else:
+                order.append(("exact", code))
+        return order
+
+    @staticmethod
+    def calculate_scores_ardf(result, context: Optional[_CheckContext] = None):
+        found_codes = set()
         ret = 0
 
-        course = race().find_course(result)
+        if context is None:
+            context = _CheckContext.from_race(race())
+        course = context.find_course(result)
         if not course:
             return ret
 
-        correct_order = [str(control.code) for control in course.controls]
+        correct_order = context.get_ardf_order(course)
 
         index_in_order = 0
 
         for cur_split in result.splits:
+            if index_in_order >= len(correct_order):
+                # the rest of the punches can't match anything
+                break
+
             code = str(cur_split.code)
 
             initial_index = index_in_order
 
             while index_in_order < len(correct_order):
-                current_cp = correct_order[index_in_order]
-
-                if "?" in current_cp:
-                    if "(" in current_cp and ")" in current_cp:
-                        options = current_cp.strip("?()").split(",")
-                        if code in options and code not in user_array:
-                            user_array.append(code)
-                            ret += 1
-                            index_in_order = initial_index + 1
-                            break
-                    else:
-                        if code not in user_array:
-                            user_array.append(code)
-                            ret += 1
-                            index_in_order = initial_index + 1
-                            break
+                kind, payload = correct_order[index_in_order]
+
+                if kind == "choice":
+                    if code in payload and code not in found_codes:
+                        found_codes.add(code)
+                        ret += 1
+                        index_in_order = initial_index + 1
+                        break
+
+                    index_in_order += 1
+                    continue
+
+                if kind == "any":
+                    if code not in found_codes:
+                        found_codes.add(code)
+                        ret += 1
+                        index_in_order = initial_index + 1
+                        break
 
                     index_in_order += 1
                     continue
 
-                if code == current_cp:
-                    if code not in user_array:
-                        user_array.append(code)
+                if code == payload:
+                    if code not in found_codes:
+                        found_codes.add(code)
                         ret += 1
                     index_in_order += 1
                     break
@@ -479,9 +643,9 @@ class ResultChecker:
                 break
 
         if result.person and result.person.group:
-            user_time = result.get_result_otime()
-            max_time = result.person.group.max_time
-            if OTime() < max_time < user_time:
+            user_msec = result.get_result_otime().to_msec()
+            max_msec = result.person.group.max_time.to_msec()
+            if 0 < max_msec < user_msec:
                 result.status = ResultStatus.DISQUALIFIED
                 return 0
 
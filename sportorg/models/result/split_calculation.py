@@ -1,11 +1,21 @@
 import logging
-from typing import Optional
+from typing import List, Optional
 
-from sportorg.models.memory import Course, Group, Qualification, ResultStatus
+from sportorg.models.memory import Course, Group, Qualification, ResultStatus, Split
 from sportorg.models.result.result_calculation import ResultCalculation
 from sportorg.utils.time import get_speed_min_per_km
 
 
+# sort order of unsuccessful results in a group
+_STATUS_PRIORITY = {
+    ResultStatus.OVERTIME.value: 1,
+    ResultStatus.MISSING_PUNCH.value: 2,
+    ResultStatus.DISQUALIFIED.value: 3,
+    ResultStatus.DID_NOT_FINISH.value: 4,
+    ResultStatus.DID_NOT_START.value: 5,
+}
+
+
 class PersonSplits:
     def __init__(self, r, result):
         self.race = r
@@ -21,6 +31,7 @@ class PersonSplits:
 
         self.relay_leg = self.result.person.bib // 1000
         self.last_correct_index = 0
+        self.legs_by_course_index: List[Optional[Split]] = []
 
     @property
     def person(self):
@@ -37,38 +48,42 @@ class PersonSplits:
     def generate(self):
         split_index = 0
         course_index = 0
-        leg_start_time = self.result.get_start_time()
         start_time = self.result.get_start_time()
+        leg_start_time = start_time
+        splits = self.result.splits
+        controls = self.course.controls
 
         if self.course.length:
             self.result.speed = get_speed_min_per_km(
                 self.result.get_result_otime(), self.course.length
             )
 
-        for split in self.result.splits:
-            split.relative_time = split.time - start_time
+        splits_count = len(splits)
+        controls_count = len(controls)
+        self.legs_by_course_index = [None] * controls_count
 
-        if not len(self.course.controls):
+        if not controls_count:
             prev_split = start_time
-            for i, split in enumerate(self.result.splits):
+            for i, split in enumerate(splits):
                 split.index = i
                 split.course_index = i
+                split.relative_time = split.time - start_time
                 split.leg_time = split.time - prev_split
                 prev_split = split.time
 
-        while split_index < len(self.result.splits) and course_index < len(
-            self.course.controls
-        ):
-            cur_split = self.result.splits[split_index]
+        while split_index < splits_count and course_index < controls_count:
+            cur_split = splits[split_index]
 
             cur_split.index = split_index
+            cur_split.relative_time = cur_split.time - start_time
 
             if cur_split.is_correct:
                 cur_split.leg_time = cur_split.time - leg_start_time
                 leg_start_time = cur_split.time
 
                 cur_split.course_index = course_index
-                cur_split.length_leg = self.course.controls[course_index].length
+                self.legs_by_course_index[course_index] = cur_split
+                cur_split.length_leg = controls[course_index].length
                 if cur_split.length_leg:
                     cur_split.speed = get_speed_min_per_km(
                         cur_split.leg_time, cur_split.length_leg
@@ -80,6 +95,11 @@ class PersonSplits:
 
             split_index += 1
 
+        if controls_count:
+            # punches after the last control of the course
+            for cur_split in splits[split_index:]:
+                cur_split.relative_time = cur_split.time - start_time
+
         self.last_correct_index = course_index - 1
         return self
 
@@ -90,9 +110,9 @@ class PersonSplits:
         if index > self.get_last_correct_index():
             return None
 
-        for i in self.result.splits:
-            if i.course_index == index:
-                return i
+        # filled by generate()
+        if 0 <= index < len(self.legs_by_course_index):
+            return self.legs_by_course_index[index]
 
         return None
 
@@ -129,10 +149,11 @@ class GroupSplits:
     def generate(self, logged=False):
         if logged:
             logging.debug("Group splits generate for " + self.group.name)
+        calculation = ResultCalculation(self.race)
         # to have group count
-        ResultCalculation(self.race).get_group_persons(self.group)
+        calculation.get_group_persons(self.group)
 
-        for i in ResultCalculation(self.race).get_group_finishes(self.group):
+        for i in calculation.get_group_finishes(self.group):
             self.person_splits.append(PersonSplits(self.race, i).generate())
 
         self.set_places()
@@ -155,49 +176,33 @@ class GroupSplits:
             self.set_places_for_leg(i, relative=True)
 
     def sort_by_leg(self, index, relative=False):
-        if relative:
-            self.person_splits = sorted(
-                self.person_splits,
-                key=lambda item: (
-                    item.get_leg_relative_time(index) is None,
-                    item.get_leg_relative_time(index),
-                ),
-            )
-        else:
-            self.person_splits = sorted(
-                self.person_splits,
-                key=lambda item: (
-                    item.get_leg_time(index) is None,
-                    item.get_leg_time(index),
-                ),
-            )
+        def sort_func(item):
+            # the leg is looked up once per person, not for each part of the key
+            leg = item.get_leg_by_course_index(index)
+            time = None
+            if leg:
+                time = leg.relative_time if relative else leg.leg_time
+            return time is None, time
 
-    def sort_by_result(self):
-        status_priority = [
-            ResultStatus.OVERTIME.value,
-            ResultStatus.MISSING_PUNCH.value,
-            ResultStatus.DISQUALIFIED.value,
-            ResultStatus.DID_NOT_FINISH.value,
-            ResultStatus.DID_NOT_START.value,
-        ]
+        self.person_splits.sort(key=sort_func)
 
+    def sort_by_result(self):
         def sort_func(item):
-            priority = 0
-            if item.result.status in status_priority:
-                priority = status_priority.index(item.result.status) + 1
+            priority = _STATUS_PRIORITY.get(item.result.status, 0)
             return item.result is None, priority, item.result
 
         self.person_splits = sorted(self.person_splits, key=sort_func)
 
     def sort_by_place(self):
-        self.person_splits = sorted(
-            self.person_splits,
-            key=lambda item: (
-                item.result.get_place() is None or item.result.get_place() == "",
-                ("0000" + str(item.result.get_place()))[-4:],
+        def sort_func(item):
+            place = item.result.get_place()
+            return (
+                place is None or place == "",
+                str(place).zfill(4)[-4:],
                 int(item.relay_leg),
-            ),
-        )
+            )
+
+        self.person_splits.sort(key=sort_func)
 
     def set_places_for_leg(self, index, relative=False):
         if not len(self.person_splits):
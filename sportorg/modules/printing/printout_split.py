@@ -21,6 +21,7 @@ class SportorgPrinter:
             win32con.MM_TWIPS
         )  # 1440 units per inch, 1/20 of dot with 72dpi
         self.y_offset = y_offset
+        self._fonts = {}
 
         self.start_page()
 
@@ -43,15 +44,28 @@ class SportorgPrinter:
     def move_cursor(self, offset):
         self.y -= int(self.scale_factor * offset)
 
+    def get_font(self, font_name, font_size, font_weight=400):
+        # GDI fonts are created once per printer and style, not for every line
+        key = (font_name, font_size, font_weight)
+        font = self._fonts.get(key)
+        if font is None:
+            font = win32ui.CreateFont(
+                {
+                    "name": font_name,
+                    "height": int(self.scale_factor * font_size),
+                    "weight": font_weight,
+                }
+            )
+            self._fonts[key] = font
+        return font
+
+    def skip_lines(self, count, font_size):
+        # same offsets as print_line, without printing anything
+        for _ in range(count):
+            self.move_cursor(font_size * 1.3)
+
     def print_line(self, text, font_name, font_size, font_weight=400):
-        font = win32ui.CreateFont(
-            {
-                "name": font_name,
-                "height": int(self.scale_factor * font_size),
-                "weight": font_weight,
-            }
-        )
-        self.dc.SelectObject(font)
+        self.dc.SelectObject(self.get_font(font_name, font_size, font_weight))
         self.dc.TextOut(self.x, self.y, str(text))
         self.move_cursor(font_size * 1.3)
 
@@ -71,11 +85,9 @@ class SportorgPrinter:
         if person is None:
             return
 
-        for _ in range(20):
-            self.print_line(".", "Arial", 1)  # empty vertical space
+        self.skip_lines(20, 1)  # empty vertical space
         self.print_bib_line(result)
-        for _ in range(7):
-            self.print_line(".", "Arial", 1)  # empty vertical space
+        self.skip_lines(7, 1)  # empty vertical space
         self.print_penalty_line(result)
 
     def print_bib_line(self, result: Result) -> None:
@@ -85,14 +97,7 @@ class SportorgPrinter:
         font_size = 50
         font_weight = 400
 
-        font = win32ui.CreateFont(
-            {
-                "name": font_name,
-                "height": int(self.scale_factor * font_size),
-                "weight": font_weight,
-            }
-        )
-        self.dc.SelectObject(font)
+        self.dc.SelectObject(self.get_font(font_name, font_size, font_weight))
         self.dc.TextOut(self.x, self.y, text)
 
         self.move_cursor(font_size * 1.3)
@@ -109,14 +114,7 @@ class SportorgPrinter:
         font_size = 50
         font_weight = 400
 
-        font = win32ui.CreateFont(
-            {
-                "name": font_name,
-                "height": int(self.scale_factor * font_size),
-                "weight": font_weight,
-            }
-        )
-        self.dc.SelectObject(font)
+        self.dc.SelectObject(self.get_font(font_name, font_size, font_weight))
         self.dc.TextOut(self.x, self.y, str(text))
 
         dx1, dy1 = self.dc.GetTextExtent(str(text))
@@ -126,14 +124,9 @@ class SportorgPrinter:
         font_size_small = 15
         font_weight = 400
 
-        font = win32ui.CreateFont(
-            {
-                "name": font_name_small,
-                "height": int(self.scale_factor * font_size_small),
-                "weight": font_weight,
-            }
+        self.dc.SelectObject(
+            self.get_font(font_name_small, font_size_small, font_weight)
         )
-        self.dc.SelectObject(font)
         _, dy2 = self.dc.GetTextExtent(str(text_small))
         dy = int(0.8 * (dy1 - dy2))  # calculate font baseline position
         self.dc.TextOut(self.x + dx1, self.y - dy, str(text_small))
@@ -160,9 +153,12 @@ class SportorgPrinter:
 
         course = obj.find_course(result)
 
-        is_penalty_used = obj.get_setting("marked_route_mode", "off") != "off"
+        penalty_mode = obj.get_setting("marked_route_mode", "off")
+        is_penalty_used = penalty_mode != "off"
         is_relay = group.is_relay()
-        is_credit_time_used = race().get_setting("credit_time_enabled", False)
+        is_credit_time_used = obj.get_setting("credit_time_enabled", False)
+        is_rogaine = obj.get_setting("result_processing_mode", "time") == "scores"
+        start_source = obj.get_setting("system_start_source", "protocol")
 
         fn = "Lucida Console"
         fs_small = 2.5
@@ -197,89 +193,69 @@ class SportorgPrinter:
             translate("Start") + ": " + result.get_start_time().to_str(), fn, fs_main
         )
 
+        # Highlight correct controls of marked route ( '31' and '31(31,32,33)' => + )
+        # all prefixes of course controls, a split is marked if its code is one of them
+        marked_prefixes = set()
+        if is_penalty_used and course:
+            for course_cp in course.controls:
+                cp = str(course_cp)
+                marked_prefixes.update(cp[:i] for i in range(len(cp) + 1))
+
         # Splits
         index = 1
         for split in result.splits:
+            code = ("  " + split.code)[-3:]
             if not is_group_existed:
-                line = (
-                    ("  " + str(index))[-3:]
-                    + " "
-                    + ("  " + split.code)[-3:]
-                    + " "
-                    + split.time.to_str()[-7:]
-                )
+                num = ("  " + str(index))[-3:]
+                line = f"{num} {code} {split.time.to_str()[-7:]}"
                 index += 1
                 self.print_line(line, fn, fs_main)
             elif not course:
-                line = (
-                    ("  " + str(index))[-3:]
-                    + " "
-                    + ("  " + split.code)[-3:]
-                    + " "
-                    + split.relative_time.to_str()[-7:]
-                    + " "
-                    + split.leg_time.to_str()[-5:]
-                )
+                num = ("  " + str(index))[-3:]
+                relative_time = split.relative_time.to_str()[-7:]
+                leg_time = split.leg_time.to_str()[-5:]
+                line = f"{num} {code} {relative_time} {leg_time}"
                 index += 1
                 self.print_line(line, fn, fs_main)
             elif split.is_correct:
-                line = (
-                    ("  " + str(split.course_index + 1))[-3:]
-                    + " "
-                    + ("  " + split.code)[-3:]
-                    + " "
-                    + split.relative_time.to_str()[-7:]
-                    + " "
-                    + split.leg_time.to_str()[-5:]
-                    + " "
-                    + split.speed
-                    + " "
-                )
+                num = ("  " + str(split.course_index + 1))[-3:]
+                relative_time = split.relative_time.to_str()[-7:]
+                leg_time = split.leg_time.to_str()[-5:]
+                line = f"{num} {code} {relative_time} {leg_time} {split.speed} "
 
                 if not is_relay:
                     line += ("  " + str(split.leg_place))[-3:]
 
-                # Highlight correct controls of marked route ( '31' and '31(31,32,33)' => + )
-                if is_penalty_used and course:
-                    for course_cp in course.controls:
-                        if str(course_cp).startswith(split.code):
-                            line += " +"
-                            break
+                if split.code in marked_prefixes:
+                    line += " +"
 
                 self.print_line(line, fn, fs_main)
             else:
-                line = (
-                    " " * 4
-                    + (" " + split.code)[-3:]
-                    + " "
-                    + split.relative_time.to_str()[-7:]
-                )
+                wrong_code = (" " + split.code)[-3:]
+                line = f"    {wrong_code} {split.relative_time.to_str()[-7:]}"
                 self.print_line(line, fn, fs_main)
 
+        finish_time = result.get_finish_time()
         finish_split = ""
         if len(result.splits) > 0:
-            finish_split = (result.get_finish_time() - result.splits[-1].time).to_str()
+            finish_split = (finish_time - result.splits[-1].time).to_str()
 
         # Finish
         self.print_line(
-            translate("Finish")
-            + ": "
-            + result.get_finish_time().to_str()
-            + " " * 4
-            + finish_split,
+            translate("Finish") + ": " + finish_time.to_str() + " " * 4 + finish_split,
             fn,
             fs_main,
         )
 
         # Result
         if is_penalty_used:
-            if obj.get_setting("marked_route_mode") == "time":
+            if penalty_mode == "time":
                 self.print_line(
                     translate("Penalty") + ": " + result.get_penalty_time().to_str(),
                     fn,
                     fs_main,
                 )
-            elif obj.get_setting("marked_route_mode") == "laps":
+            elif penalty_mode == "laps":
                 self.print_line(
                     translate("Penalty") + ": " + str(result.penalty_laps),
                     fn,
@@ -293,7 +269,6 @@ class SportorgPrinter:
                 fs_main,
             )
 
-        is_rogaine = race().get_setting("result_processing_mode", "time") == "scores"
         if is_rogaine and result.rogaine_penalty > 0:
             penalty = result.rogaine_penalty
             total_score = result.rogaine_score + penalty
@@ -308,20 +283,11 @@ class SportorgPrinter:
                 fs_main,
             )
 
-        if result.is_status_ok():
-            self.print_line(
-                translate("Result")
-                + ": "
-                + result.get_result()
-                + " " * 4
-                + result.speed,
-                fn,
-                fs_main,
-            )
-        else:
-            self.print_line(
-                translate("Result") + ": " + result.get_result(), fn, fs_main
-            )
+        is_status_ok = result.is_status_ok()
+        result_line = translate("Result") + ": " + result.get_result()
+        if is_status_ok:
+            result_line += " " * 4 + result.speed
+        self.print_line(result_line, fn, fs_main)
 
         if is_relay and person.bib > 1000:
             self.print_line(
@@ -349,13 +315,8 @@ class SportorgPrinter:
             self.print_line(place, fn, fs_main)
 
         # Info about competitors, who can win current person
-        if (
-            result.is_status_ok()
-            and not is_relay
-            and not is_rogaine
-            and is_group_existed
-        ):
-            if obj.get_setting("system_start_source", "protocol") == "protocol":
+        if is_status_ok and not is_relay and not is_rogaine and is_group_existed:
+            if start_source == "protocol":
                 if hasattr(result, "can_win_count"):
                     if result.can_win_count > 0:
                         self.print_line(
@@ -377,7 +338,7 @@ class SportorgPrinter:
 
         # Punch checking info
         if is_group_existed:
-            if result.is_status_ok():
+            if is_status_ok:
                 self.print_line(translate("Status: OK"), fn, fs_large, 700)
             else:
                 self.print_line(translate("Status: DSQ"), fn, fs_large, 700)
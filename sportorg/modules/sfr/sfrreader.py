@@ -26,13 +26,17 @@ class SFRReaderCommand:
 
 class SFRReaderThread(QThread):
     POLL_TIMEOUT = 0.2
+    # right after a card the station is polled more often, the interval then
+    # doubles on every empty poll up to POLL_TIMEOUT
+    POLL_TIMEOUT_MIN = 0.01
 
-    def __init__(self, queue, stop_event, logger, debug=False):
+    def __init__(self, queue, stop_event, ready_event, logger, debug=False):
         super().__init__()
         # self.setName(self.__class__.__name__)
         self.setObjectName(self.__class__.__name__)
         self._queue = queue
         self._stop_event = stop_event
+        self._ready_event = ready_event
         self._logger = logger
         self._debug = debug
 
@@ -42,17 +46,21 @@ class SFRReaderThread(QThread):
         except Exception as e:
             self._logger.error(str(e))
             return
+        self._ready_event.set()
+        poll_timeout = self.POLL_TIMEOUT
         while True:
             try:
                 while not sfr.poll_card():
-                    time.sleep(self.POLL_TIMEOUT)
+                    time.sleep(poll_timeout)
+                    poll_timeout = min(poll_timeout * 2, self.POLL_TIMEOUT)
                     if not main_thread().is_alive() or self._stop_event.is_set():
                         sfr.disconnect()
                         self._logger.debug("Stop sfrreader")
                         return
+                poll_timeout = self.POLL_TIMEOUT_MIN
                 card_data = sfr.read_card()
                 if sfr.is_card_connected():
-                    self._queue.put(SFRReaderCommand("card_data", card_data), timeout=1)
+                    self._queue.put_nowait(SFRReaderCommand("card_data", card_data))
                     sfr.ack_card()
             except SFRReaderException as e:
                 self._logger.error(str(e))
@@ -64,18 +72,21 @@ class SFRReaderThread(QThread):
 
 class ResultThread(QThread):
     data_sender = Signal(object)
+    # maximum time to wait for the reader to open the station
+    READY_TIMEOUT = 3
 
-    def __init__(self, queue, stop_event, logger, start_time=None):
+    def __init__(self, queue, stop_event, ready_event, logger, start_time=None):
         super().__init__()
         # self.setName(self.__class__.__name__)
         self.setObjectName(self.__class__.__name__)
         self._queue = queue
         self._stop_event = stop_event
+        self._ready_event = ready_event
         self._logger = logger
         self.start_time = start_time
 
     def run(self):
-        time.sleep(3)
+        self._ready_event.wait(self.READY_TIMEOUT)
         while True:
             try:
                 cmd = self._queue.get(timeout=5)
@@ -95,23 +106,28 @@ class ResultThread(QThread):
 
     @staticmethod
     def _get_result(card_data):
-        result = memory.race().new_result(memory.ResultSFR)
+        obj = memory.race()
+        result = obj.new_result(memory.ResultSFR)
         result.card_number = card_data["bib"]  # SFR has no card id, only bib
 
-        for i in range(len(card_data["punches"])):
-            t = card_data["punches"][i][1]
-            if t:
-                split = memory.Split()
-                split.code = str(card_data["punches"][i][0])
-                split.time = time_to_otime(t)
-                split.days = memory.race().get_days(t)
-                if split.code != "0" and split.code != "":
-                    result.splits.append(split)
-
-        if card_data["start"]:
-            result.start_time = time_to_otime(card_data["start"])
-        if card_data["finish"]:
-            result.finish_time = time_to_otime(card_data["finish"])
+        splits = []
+        for punch_code, t in card_data["punches"]:
+            # skip empty punches before creating a split for them
+            if not t or not punch_code:
+                continue
+            split = memory.Split()
+            split.code = str(punch_code)
+            split.time = time_to_otime(t)
+            split.days = obj.get_days(t)
+            splits.append(split)
+        result.splits = splits
+
+        start = card_data["start"]
+        if start:
+            result.start_time = time_to_otime(start)
+        finish = card_data["finish"]
+        if finish:
+            result.finish_time = time_to_otime(finish)
 
         return result
 
@@ -136,6 +152,7 @@ class SFRReaderClient:
     def __init__(self):
         self._queue = Queue()
         self._stop_event = Event()
+        self._ready_event = Event()
         self._reader_thread = None
         self._result_thread = None
         self._logger = logging.root
@@ -149,7 +166,11 @@ class SFRReaderClient:
     def _start_reader_thread(self):
         if self._reader_thread is None:
             self._reader_thread = SFRReaderThread(
-                self._queue, self._stop_event, self._logger, debug=True
+                self._queue,
+                self._stop_event,
+                self._ready_event,
+                self._logger,
+                debug=True,
             )
             self._reader_thread.start()
         # elif not self._reader_thread.is_alive():
@@ -160,7 +181,11 @@ class SFRReaderClient:
     def _start_result_thread(self):
         if self._result_thread is None:
             self._result_thread = ResultThread(
-                self._queue, self._stop_event, self._logger, self.get_start_time()
+                self._queue,
+                self._stop_event,
+                self._ready_event,
+                self._logger,
+                self.get_start_time(),
             )
             if self._call_back:
                 self._result_thread.data_sender.connect(self._call_back)
@@ -182,6 +207,7 @@ class SFRReaderClient:
 
     def start(self):
         self._stop_event.clear()
+        self._ready_event.clear()
         self._start_reader_thread()
         self._start_result_thread()
 
@@ -1,29 +1,69 @@
+import atexit
 import logging
-import sys
 from datetime import datetime
-from multiprocessing import Process
+from queue import Empty, Queue
+from threading import Lock, Thread
 
 from sportorg import config
-from sportorg.common.fake_std import FakeStd
 from sportorg.utils.time import time_to_hhmmss
 
 
-class BackupProcess(Process):
-    def __init__(self, text):
-        super().__init__()
-        self.data = text
+class BackupThread(Thread):
+    def __init__(self, queue):
+        super().__init__(name="BackupThread", daemon=True)
+        self._queue = queue
 
     def run(self):
-        try:
-            sys.stdout = FakeStd()
-            sys.stderr = FakeStd()
-            with open(
-                config.log_dir("si{}.log".format(datetime.now().strftime("%Y%m%d"))),
-                "a",
-            ) as f:
-                f.write(self.data)
-        except Exception as e:
-            logging.error(str(e))
+        stop = False
+        while not stop:
+            texts = []
+            text = self._queue.get()
+            # write all pending cards with one open of the log file,
+            # None is the stop signal sent on exit
+            while True:
+                if text is None:
+                    stop = True
+                else:
+                    texts.append(text)
+                try:
+                    text = self._queue.get_nowait()
+                except Empty:
+                    break
+            if not texts:
+                continue
+            try:
+                with open(
+                    config.log_dir(
+                        "si{}.log".format(datetime.now().strftime("%Y%m%d"))
+                    ),
+                    "a",
+                ) as f:
+                    f.write("".join(texts))
+            except Exception as e:
+                logging.error(str(e))
+
+
+_queue = Queue()
+_thread = None
+_thread_lock = Lock()
+
+
+def _write(text):
+    global _thread
+    with _thread_lock:
+        if _thread is None or not _thread.is_alive():
+            _thread = BackupThread(_queue)
+            _thread.start()
+        _queue.put(text)
+
+
+@atexit.register
+def _stop_thread():
+    """Write out the cards still queued before the interpreter exits"""
+    with _thread_lock:
+        if _thread is not None and _thread.is_alive():
+            _queue.put(None)
+            _thread.join()
 
 
 def backup_data(card_data):
@@ -41,4 +81,4 @@ def backup_data(card_data):
     text += "split_end\n"
     text += "end\n"
 
-    BackupProcess(text).start()
+    _write(text)
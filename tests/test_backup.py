@@ -0,0 +1,26 @@
+import datetime
+
+from sportorg import config
+from sportorg.modules.sportident import backup
+
+
+def test_backup_data(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        config, "log_dir", lambda *paths: str(tmp_path.joinpath(*paths))
+    )
+    t = datetime.datetime(2000, 1, 1, 10, 0, 0)
+    card_data = {
+        "card_number": 123,
+        "start": t,
+        "finish": t + datetime.timedelta(minutes=30),
+        "punches": [(31, t + datetime.timedelta(minutes=10))],
+    }
+
+    backup.backup_data(card_data)
+    backup.backup_data(card_data)
+    # the same call that flushes the queue on exit
+    backup._stop_thread()
+
+    log_file = tmp_path / "si{}.log".format(datetime.datetime.now().strftime("%Y%m%d"))
+    text = "start\n123\n10:00:00\n10:30:00\nsplit_start\n31 10:10:00\nsplit_end\nend\n"
+    assert log_file.read_text() == text * 2
@@ -1,7 +1,23 @@
+import os
+
 import pytest
 
-from sportorg.gui.tabs.memory_model import AbstractSportOrgMemoryModel
+try:
+    from PySide6.QtWidgets import QApplication, QTableView
+except ModuleNotFoundError:
+    from PySide2.QtWidgets import QApplication, QTableView
+
+from sportorg.gui.tabs.memory_model import (
+    AbstractSportOrgMemoryModel,
+    CourseMemoryModel,
+    GroupMemoryModel,
+    OrganizationMemoryModel,
+    PersonMemoryModel,
+    ResultMemoryModel,
+)
 from sportorg.language import translate
+from sportorg.models.memory import Race, ResultSportident, new_event, race
+from sportorg.modules.backup.file import File
 
 
 @pytest.mark.parametrize(
@@ -91,3 +107,58 @@ def test_filter_wrong_action(pattern, value, expected):
     check = model.compile_regex(translate("wrong action"), pattern)
     result = model.match_value(check, value)
     assert result == expected
+
+
+def test_result_model_rows_are_a_snapshot():
+    new_event([Race()])
+    for card_number in (1, 2):
+        result = race().new_result(ResultSportident)
+        result.card_number = card_number
+        race().add_new_result(result)
+
+    model = ResultMemoryModel()
+    assert model.rowCount() == 2
+    first_row = model.get_cached_row(0)
+
+    # a new result read before the table is refreshed
+    result = race().new_result(ResultSportident)
+    result.card_number = 3
+    race().add_new_result(result)
+
+    assert model.rowCount() == 2
+    assert model.get_cached_row(0) == first_row
+    assert (
+        model.get_cached_row(1)[9] == model.get_values_from_object(race().results[2])[9]
+    )
+
+    model.init_cache()
+    assert model.rowCount() == 3
+
+
+@pytest.fixture(scope="module")
+def app():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.mark.parametrize(
+    "model_class",
+    [
+        PersonMemoryModel,
+        ResultMemoryModel,
+        GroupMemoryModel,
+        CourseMemoryModel,
+        OrganizationMemoryModel,
+    ],
+)
+def test_paint_table_view(app, model_class):
+    File("tests/data/test.json").open()
+    model = model_class()
+    assert model.rowCount()
+
+    view = QTableView()
+    view.setModel(model)
+    view.resize(800, 600)
+    # painting asks the model for every role of the visible cells
+    for _ in range(30):
+        assert not view.grab().isNull()
@@ -5,6 +5,7 @@ import pytest
 
 from sportorg.common.otime import OTime
 from sportorg.models.memory import (
+    ControlPoint,
     Course,
     CourseControl,
     Group,
@@ -425,6 +426,18 @@ def test_calculate_score_allow_duplicates(score_mode, controls, expected):
     assert ResultChecker.calculate_rogaine_score(res, allow_duplicates=True) == expected
 
 
+def test_calculate_score_from_control_points():
+    create_race()
+    race().set_setting("result_processing_score_mode", "fixed")
+    for code, score in (("31", 5), ("32", 0), ("31", 7)):
+        control = create(ControlPoint, code=code)
+        control.score = score
+        race().controls.append(control)
+    res = make_result([31, 32, 33])
+    # the first control point with the code is used, zero score falls back to mode
+    assert ResultChecker.calculate_rogaine_score(res) == 7
+
+
 # fmt: off
 @pytest.mark.parametrize(
     'step, score, max_time, finish, expected',
@@ -0,0 +1,40 @@
+import datetime
+
+from sportorg.common.otime import OTime
+from sportorg.models.memory import Race, ResultSFR, new_event, race
+from sportorg.modules.sfr.sfrreader import ResultThread
+
+
+def test_get_result():
+    new_event([Race()])
+    card_data = {
+        "bib": 123,
+        "punches": [
+            (31, datetime.datetime(2000, 1, 1, 10, 1, 2)),
+            (0, datetime.datetime(2000, 1, 1, 10, 2, 0)),
+            (32, None),
+            (33, datetime.datetime(2000, 1, 1, 10, 3, 4)),
+        ],
+        "start": datetime.datetime(2000, 1, 1, 10, 0, 0),
+        "finish": datetime.datetime(2000, 1, 1, 10, 5, 0),
+    }
+
+    result = ResultThread._get_result(card_data)
+
+    assert isinstance(result, ResultSFR)
+    assert result.card_number == 123
+    assert [split.code for split in result.splits] == ["31", "33"]
+    assert result.splits[0].time == OTime(hour=10, minute=1, sec=2)
+    assert result.start_time == OTime(hour=10)
+    assert result.finish_time == OTime(hour=10, minute=5)
+    assert result not in race().results
+
+
+def test_get_result_without_times():
+    new_event([Race()])
+    card_data = {"bib": 5, "punches": [], "start": None, "finish": None}
+
+    result = ResultThread._get_result(card_data)
+
+    assert result.splits == []
+    assert not result.start_time
@@ -1,4 +1,21 @@
-from sportorg.common.template import get_text_from_file
+import functools
+import gzip
+import io
+import os
+from unittest import mock
+
+import pytest
+from jinja2 import Template, TemplateNotFound
+
+from sportorg import config
+from sportorg.common import template
+from sportorg.common.template import (
+    get_template,
+    get_templates,
+    get_text_from_file,
+    write_text_from_file,
+)
+from sportorg.gui.dialogs.report_dialog import ReportWriteThread
 from sportorg.models.constant import RentCards
 from sportorg.models.memory import get_current_race_index, races
 from sportorg.modules.backup.file import File
@@ -18,3 +35,77 @@ def test_generate_report():
     )
 
     assert result
+
+
+def test_write_report_to_file(monkeypatch):
+    # the compress filter stores the gzip mtime, keep it equal for both renders
+    monkeypatch.setattr(gzip, "compress", functools.partial(gzip.compress, mtime=0))
+    File("tests/data/test.json").open()
+    races_dict = [r.to_dict() for r in races()]
+    context = dict(
+        race=races_dict[get_current_race_index()],
+        races=races_dict,
+        rent_cards=list(RentCards().get()),
+        current_race=get_current_race_index(),
+        selected={"persons": []},
+    )
+
+    file = io.StringIO()
+    write_text_from_file("reports/1_results.html", file, **context)
+
+    assert file.getvalue() == get_text_from_file("reports/1_results.html", **context)
+
+
+def test_get_templates_sees_new_files(tmp_path):
+    (tmp_path / "a.html").write_text("")
+    assert get_templates(str(tmp_path), str(tmp_path)) == ["/a.html"]
+    assert get_templates(str(tmp_path), str(tmp_path)) == ["/a.html"]
+
+    (tmp_path / "b.html").write_text("")
+    assert sorted(get_templates(str(tmp_path), str(tmp_path))) == [
+        "/a.html",
+        "/b.html",
+    ]
+
+
+def test_get_templates_caches_unchanged_dirs(tmp_path, monkeypatch):
+    (tmp_path / "a.html").write_text("")
+    os.utime(tmp_path, (1, 1))
+    scan = mock.Mock(wraps=template._scan_templates)
+    monkeypatch.setattr(template, "_scan_templates", scan)
+
+    assert get_templates(str(tmp_path), str(tmp_path)) == ["/a.html"]
+    assert get_templates(str(tmp_path), str(tmp_path)) == ["/a.html"]
+    assert scan.call_count == 1
+
+
+def test_get_template_not_found():
+    with pytest.raises(TemplateNotFound):
+        get_template("reports/not_existing_template.html")
+
+
+def test_report_write_thread(tmp_path):
+    file_name = str(tmp_path / "report.html")
+    thread = ReportWriteThread(
+        Template("{{ name }}: {{ value }}"), file_name, {"value": 1}
+    )
+    thread.start()
+    thread.join()
+
+    with open(file_name, encoding="utf-8") as f:
+        assert f.read() == "{}: 1".format(config.NAME)
+    assert os.listdir(str(tmp_path)) == ["report.html"]
+
+
+def test_report_write_thread_keeps_previous_report_on_error(tmp_path):
+    file_name = str(tmp_path / "report.html")
+    with open(file_name, "w", encoding="utf-8") as f:
+        f.write("previous")
+
+    thread = ReportWriteThread(Template("{{ 1 // value }}"), file_name, {"value": 0})
+    thread.start()
+    thread.join()
+
+    with open(file_name, encoding="utf-8") as f:
+        assert f.read() == "previous"
+    assert os.listdir(str(tmp_path)) == ["report.html"]